@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""
+Optional Numba-compiled and numexpr kernels for computations along trajectories.
+
+Numba and numexpr are not required dependencies. If they are not installed,
+HAS_NUMBA and HAS_NUMEXPR are False and callers fall back to the NumPy
+implementations in geometry_utils.
+"""
+
+from math import atan2, cos, degrees, radians, sin, sqrt
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import numexpr
+
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+# Below this size, NumPy is fast enough and avoids the JIT warm-up cost
+NUMBA_MIN_SIZE = 1_000
+# Above this size, the work is split across threads
+PARALLEL_MIN_SIZE = 100_000
+# Below this size, the numexpr call overhead outweighs the fused evaluation
+NUMEXPR_MIN_SIZE = 10_000
+
+
+def _directions(x, y, is_latlon, out):
+    for i in prange(out.shape[0]):
+        x0, y0, x1, y1 = x[i], y[i], x[i + 1], y[i + 1]
+        if x0 == x1 and y0 == y1:
+            out[i] = 0.0
+        elif is_latlon:
+            phi1 = radians(y0)
+            phi2 = radians(y1)
+            delta_lon = radians(x1 - x0)
+            dx = sin(delta_lon) * cos(phi2)
+            dy = cos(phi1) * sin(phi2) - sin(phi1) * cos(phi2) * cos(delta_lon)
+            out[i] = (degrees(atan2(dx, dy)) + 360) % 360
+        else:
+            angle = degrees(atan2(x1 - x0, y1 - y0))
+            out[i] = angle + 360 if angle < 0 else angle
+
+
+def _haversine_distances(lon1, lat1, lon2, lat2, radius, out):
+    for i in prange(out.shape[0]):
+        delta_lat = radians(lat2[i] - lat1[i])
+        delta_lon = radians(lon2[i] - lon1[i])
+        a = sin(delta_lat / 2) * sin(delta_lat / 2) + cos(radians(lat1[i])) * cos(
+            radians(lat2[i])
+        ) * sin(delta_lon / 2) * sin(delta_lon / 2)
+        out[i] = radius * 2 * atan2(sqrt(a), sqrt(1 - a))
+
+
+if HAS_NUMBA:
+    _haversine_distances_serial = njit(fastmath=True, cache=True)(_haversine_distances)
+    _haversine_distances_parallel = njit(fastmath=True, cache=True, parallel=True)(
+        _haversine_distances
+    )
+    _directions_serial = njit(fastmath=True, cache=True)(_directions)
+    _directions_parallel = njit(fastmath=True, cache=True, parallel=True)(_directions)
+
+
+def haversine_distances(lon1, lat1, lon2, lat2, radius):
+    """
+    Calculate the spherical distances between arrays of start and end
+    coordinates on a sphere with the given radius using the compiled kernel.
+
+    Requires Numba (see HAS_NUMBA).
+    """
+    lon1, lat1, lon2, lat2 = (
+        np.ascontiguousarray(arr, dtype=np.float64) for arr in (lon1, lat1, lon2, lat2)
+    )
+    out = np.empty(lon1.shape[0], dtype=np.float64)
+    if out.shape[0] >= PARALLEL_MIN_SIZE:
+        _haversine_distances_parallel(lon1, lat1, lon2, lat2, float(radius), out)
+    else:
+        _haversine_distances_serial(lon1, lat1, lon2, lat2, float(radius), out)
+    return out
+
+
+def directions(x, y, is_latlon):
+    """
+    Calculate the directions between consecutive coordinates using the
+    compiled kernel: compass bearings if is_latlon is True, otherwise
+    euclidean azimuths. Directions between equal points are 0.
+
+    Requires Numba (see HAS_NUMBA).
+    """
+    x, y = (np.ascontiguousarray(arr, dtype=np.float64) for arr in (x, y))
+    out = np.empty(max(x.shape[0] - 1, 0), dtype=np.float64)
+    # passed as int8 so that Numba compiles one specialization for both cases
+    is_latlon = np.int8(1 if is_latlon else 0)
+    if out.shape[0] >= PARALLEL_MIN_SIZE:
+        _directions_parallel(x, y, is_latlon, out)
+    else:
+        _directions_serial(x, y, is_latlon, out)
+    return out
+
+
+def haversine_distances_numexpr(lon1, lat1, lon2, lat2, radius):
+    """
+    Calculate the spherical distances between arrays of start and end
+    coordinates on a sphere with the given radius using numexpr.
+
+    Requires numexpr (see HAS_NUMEXPR).
+    """
+    local_dict = {
+        "lon1": lon1,
+        "lat1": lat1,
+        "lon2": lon2,
+        "lat2": lat2,
+        "rad": np.pi / 180,
+    }
+    a = numexpr.evaluate(
+        "sin((lat2 - lat1) * rad / 2) ** 2"
+        " + cos(lat1 * rad) * cos(lat2 * rad) * sin((lon2 - lon1) * rad / 2) ** 2",
+        local_dict=local_dict,
+    )
+    return numexpr.evaluate(
+        "radius * 2 * arctan2(sqrt(a), sqrt(1 - a))",
+        local_dict={"a": a, "radius": float(radius)},
+    )
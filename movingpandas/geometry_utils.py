@@ -2,10 +2,20 @@
 
 from math import atan2, cos, degrees, pi, radians, sin, sqrt
 
+import numpy as np
 import shapely
 from geopy import distance
 from packaging.version import Version
-from shapely.geometry import LineString, Point
+from shapely.geometry import LineString, MultiPoint, Point
+
+from . import _kernels
+
+try:
+    from pyproj import Geod
+
+    _GEOD_WGS84 = Geod(ellps="WGS84")
+except ImportError:
+    _GEOD_WGS84 = None
 
 try:
     SHAPELY_GE_2 = Version(shapely.__version__) >= Version("2.0.0")
@@ -137,6 +147,168 @@ def azimuth(point1, point2):
     return azimuth
 
 
+def get_point_coordinates(points, include_z=False):
+    """
+    Return the coordinates of an array of shapely Points as (N, 2) float array,
+    or (N, 3) float array if include_z is True.
+
+    Raises a ValueError if the array contains anything but non-empty Points.
+    """
+    points = np.asarray(points)
+    if SHAPELY_GE_2:
+        invalid = (shapely.get_type_id(points) != 0) | shapely.is_empty(points)
+        if not invalid.any():
+            return shapely.get_coordinates(points, include_z=include_z)
+        invalid_pt = points[invalid.argmax()]
+    else:
+        try:
+            if include_z:
+                return np.array(
+                    [(pt.x, pt.y, pt.z if pt.has_z else np.nan) for pt in points],
+                    dtype=float,
+                )
+            return np.array([(pt.x, pt.y) for pt in points], dtype=float)
+        except (AttributeError, ValueError, IndexError):
+            invalid_pt = next(
+                pt for pt in points if not isinstance(pt, Point) or pt.is_empty
+            )
+    raise ValueError("Invalid trajectory! Got {} instead of point!".format(invalid_pt))
+
+
+def connect_consecutive_points(points):
+    """
+    Return array of LineStrings connecting consecutive shapely Points.
+
+    If two consecutive points are equal, the end point is shifted slightly to
+    avoid intersection issues with zero length lines.
+    """
+    points = np.asarray(points)
+    if SHAPELY_GE_2:
+        include_z = bool(shapely.has_z(points).any())
+    else:
+        include_z = any(pt.has_z for pt in points)
+    coords = get_point_coordinates(points, include_z=include_z)
+    start, end = coords[:-1], coords[1:].copy()
+    same = (start == end).all(axis=1)
+    end[same, :2] += 0.00000001
+    segments = np.stack([start, end], axis=1)
+    if SHAPELY_GE_2:
+        return shapely.linestrings(segments)
+    lines = np.empty(len(segments), dtype=object)
+    lines[:] = [LineString(segment) for segment in segments]
+    return lines
+
+
+def convex_hull_of_points(points):
+    """
+    Return the convex hull of an array of shapely Points.
+    """
+    points = np.asarray(points)
+    if SHAPELY_GE_2:
+        include_z = bool(shapely.has_z(points).any())
+        coords = shapely.get_coordinates(points, include_z=include_z)
+        return shapely.convex_hull(shapely.multipoints(coords))
+    return MultiPoint(list(points)).convex_hull
+
+
+def measure_distances_euclidean(x1, y1, x2, y2):
+    """
+    Return euclidean distances between arrays of start and end coordinates.
+    """
+    return np.hypot(x2 - x1, y2 - y1)
+
+
+def measure_distances_to(geometry, others):
+    """
+    Return euclidean distances between a shapely geometry and a list of
+    shapely geometries as float array.
+    """
+    others_array = np.empty(len(others), dtype=object)
+    others_array[:] = others
+    if SHAPELY_GE_2:
+        return shapely.distance(geometry, others_array)
+    return np.array([geometry.distance(other) for other in others_array], dtype=float)
+
+
+def measure_distances_geodesic(lon1, lat1, lon2, lat2):
+    """
+    Return geodesic distances (on a WGS84 ellipsoid) in meters between arrays
+    of start and end coordinates.
+    """
+    if _GEOD_WGS84 is not None:
+        if np.size(lon1) == 1:
+            # pyproj (checked with 3.7.2) first tries its scalar fast path,
+            # which converts size-1 arrays to floats and thereby triggers a
+            # DeprecationWarning with NumPy >= 1.25
+            coords = (float(v[0]) for v in (lon1, lat1, lon2, lat2))
+            return np.array([_GEOD_WGS84.inv(*coords)[2]])
+        return _GEOD_WGS84.inv(lon1, lat1, lon2, lat2)[2]
+    return np.array(
+        [
+            distance.distance((y1, x1), (y2, x2)).meters
+            for x1, y1, x2, y2 in zip(lon1, lat1, lon2, lat2)
+        ],
+        dtype=float,
+    )
+
+
+def measure_distances_spherical(lon1, lat1, lon2, lat2):
+    """
+    Return spherical (haversine) distances in meters between arrays of start
+    and end coordinates.
+
+    Vectorized version of measure_distance_spherical. Uses a compiled kernel
+    for large arrays if Numba is installed, or else numexpr if it is installed.
+    """
+    if _kernels.HAS_NUMBA and np.size(lon1) >= _kernels.NUMBA_MIN_SIZE:
+        return _kernels.haversine_distances(lon1, lat1, lon2, lat2, R_EARTH)
+    if _kernels.HAS_NUMEXPR and np.size(lon1) >= _kernels.NUMEXPR_MIN_SIZE:
+        return _kernels.haversine_distances_numexpr(lon1, lat1, lon2, lat2, R_EARTH)
+    delta_lat = np.radians(lat2 - lat1)
+    delta_lon = np.radians(lon2 - lon1)
+    a = np.sin(delta_lat / 2) * np.sin(delta_lat / 2) + np.cos(
+        np.radians(lat1)
+    ) * np.cos(np.radians(lat2)) * np.sin(delta_lon / 2) * np.sin(delta_lon / 2)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return R_EARTH * c
+
+
+def measure_length_geodesic(lon, lat):
+    """
+    Return the geodesic length (on a WGS84 ellipsoid) in meters of the line
+    connecting the given coordinates.
+    """
+    if _GEOD_WGS84 is not None:
+        return _GEOD_WGS84.line_length(lon, lat)
+    return distance.geodesic(*zip(lat, lon)).meters
+
+
+def calculate_compass_bearings(lon1, lat1, lon2, lat2):
+    """
+    Calculate the bearings between arrays of start and end coordinates.
+
+    Vectorized version of calculate_initial_compass_bearing.
+    """
+    lat1 = np.radians(lat1)
+    lat2 = np.radians(lat2)
+    delta_lon = np.radians(lon2 - lon1)
+    x = np.sin(delta_lon) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - (np.sin(lat1) * np.cos(lat2) * np.cos(delta_lon))
+    initial_bearing = np.degrees(np.arctan2(x, y))
+    return (initial_bearing + 360) % 360
+
+
+def azimuths(x1, y1, x2, y2):
+    """
+    Calculates euclidean bearings of lines between arrays of start and end
+    coordinates.
+
+    Vectorized version of azimuth.
+    """
+    angle = np.arctan2(x2 - x1, y2 - y1)
+    return np.where(angle < 0, np.degrees(angle) + 360, np.degrees(angle))
+
+
 def angular_difference(degrees1, degrees2):
     """
     Calculates the smaller angle between the provided bearings / headings.
@@ -147,6 +319,16 @@ def angular_difference(degrees1, degrees2):
     return diff
 
 
+def angular_differences(degrees1, degrees2):
+    """
+    Calculates the smaller angles between arrays of bearings / headings.
+
+    Vectorized version of angular_difference.
+    """
+    diff = np.abs(degrees1 - degrees2)
+    return np.where(diff > 180, np.abs(diff - 360), diff)
+
+
 def mrr_diagonal(geom, spherical=False):
     """
     Calculate the length of the diagonal of the minimum rotated rectangle of
@@ -170,6 +352,13 @@ def point_gdf_to_linestring(df, geom_col_name):
     Convert GeoDataFrame of Points to shapely LineString
     """
     if len(df) > 1:
+        if SHAPELY_GE_2:
+            # build the line from the coordinate array instead of Point objects
+            points = np.asarray(df[geom_col_name].values)
+            include_z = bool(shapely.has_z(points).any())
+            return shapely.linestrings(
+                shapely.get_coordinates(points, include_z=include_z)
+            )
         return LineString(df[geom_col_name].tolist())
     else:
         raise RuntimeError("DataFrame needs at least two points to make line!")
@@ -82,8 +82,23 @@ def is_equal(t1, t2):
     return td < timedelta(milliseconds=10)
 
 
+def _bounds_disjoint(bounds1, bounds2):
+    """
+    Returns whether the bounding boxes (minx, miny, maxx, maxy) are disjoint.
+    """
+    return (
+        bounds1[2] < bounds2[0]
+        or bounds2[2] < bounds1[0]
+        or bounds1[3] < bounds2[1]
+        or bounds2[3] < bounds1[1]
+    )
+
+
 def intersects(traj, polygon):
     try:
+        # cheap rejection of polygons outside the trajectory's bounding box
+        if _bounds_disjoint(traj._get_bounds(), polygon.bounds):
+            return False
         line = traj.to_linestring()
     except:  # noqa: E722
         return False
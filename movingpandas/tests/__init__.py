@@ -14,3 +14,5 @@ def _importorskip(modname):
 
 has_stonesoup, requires_stonesoup = _importorskip("stonesoup")
 has_holoviews, requires_holoviews = _importorskip("holoviews")
+has_numba, requires_numba = _importorskip("numba")
+has_numexpr, requires_numexpr = _importorskip("numexpr")
@@ -1,16 +1,29 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
+from geopandas import GeoDataFrame
 from math import sqrt
-from shapely.geometry import MultiPoint, Point
+from shapely.geometry import LineString, MultiPoint, Point
 from movingpandas.geometry_utils import (
     azimuth,
+    azimuths,
+    calculate_compass_bearings,
     calculate_initial_compass_bearing,
+    connect_consecutive_points,
+    convex_hull_of_points,
     angular_difference,
+    angular_differences,
+    get_point_coordinates,
     mrr_diagonal,
     measure_distance_geodesic,
     measure_distance_euclidean,
     measure_distance_spherical,
+    measure_distances_euclidean,
+    measure_distances_geodesic,
+    measure_distances_spherical,
+    measure_length_geodesic,
+    point_gdf_to_linestring,
 )
 
 
@@ -70,6 +83,12 @@ class TestGeometryUtils:
     def test_anglular_difference_twonegative(self):
         assert angular_difference(-200, -160) == 40
 
+    def test_anglular_differences(self):
+        result = angular_differences(
+            np.array([1, 355, 180, 45, -45, -200]), np.array([5, 5, 0, 45, 45, -160])
+        )
+        assert result.tolist() == [4, 10, 180, 0, 90, 40]
+
     def test_mrr_diagonal(self):
         assert mrr_diagonal(
             MultiPoint([Point(0, 0), Point(0, 2), Point(2, 0), Point(2, 2)])
@@ -126,3 +145,79 @@ class TestGeometryUtils:
             ),
             spherical=True,
         ) == pytest.approx(3944411)
+
+    def test_get_point_coordinates(self):
+        coords = get_point_coordinates([Point(0, 1), Point(2, 3)])
+        assert coords.tolist() == [[0, 1], [2, 3]]
+
+    def test_get_point_coordinates_throws_value_error(self):
+        with pytest.raises(ValueError):
+            get_point_coordinates([Point(0, 1), LineString([(0, 0), (1, 1)])])
+
+    def test_azimuths(self):
+        x1, y1 = np.zeros(4), np.zeros(4)
+        x2, y2 = np.array([1, -10, 1, -1]), np.array([0, 0, 1, -1])
+        assert azimuths(x1, y1, x2, y2).tolist() == [90, 270, 45, 225]
+
+    def test_calculate_compass_bearings(self):
+        x1, y1 = np.zeros(4), np.zeros(4)
+        x2, y2 = np.array([10, -10, 0, 0]), np.array([0, 0, 10, -10])
+        result = calculate_compass_bearings(x1, y1, x2, y2)
+        assert result.tolist() == [90, 270, 0, 180]
+
+    def test_euclidean_distances(self):
+        result = measure_distances_euclidean(
+            np.array([0, 0]), np.array([0, 0]), np.array([0, 3]), np.array([1, 4])
+        )
+        assert result.tolist() == [1, 5]
+
+    def test_geodesic_distances(self, recwarn):
+        result = measure_distances_geodesic(
+            np.array([-74.00597]),
+            np.array([40.71427]),
+            np.array([-118.24368]),
+            np.array([34.05223]),
+        )
+        assert result.tolist() == [pytest.approx(3944411)]
+        assert not [w for w in recwarn if w.category is DeprecationWarning]
+
+    def test_spherical_distances(self):
+        result = measure_distances_spherical(
+            np.array([0.0, 1]), np.array([0.0, 0]), np.array([1.0, 1]), np.array([0, 1])
+        )
+        assert result.tolist() == [
+            measure_distance_spherical(Point(0, 0), Point(1, 0)),
+            measure_distance_spherical(Point(1, 0), Point(1, 1)),
+        ]
+
+    def test_geodesic_length(self):
+        lon = np.array([-74.00597, -118.24368, -118.24368])
+        lat = np.array([40.71427, 34.05223, 34.05223])
+        assert measure_length_geodesic(lon, lat) == pytest.approx(3944411)
+
+    def test_point_gdf_to_linestring(self):
+        gdf = GeoDataFrame(geometry=[Point(0, 0), Point(1, 2), Point(3, 4)])
+        line = point_gdf_to_linestring(gdf, "geometry")
+        assert line.wkt == "LINESTRING (0 0, 1 2, 3 4)"
+
+    def test_point_gdf_to_linestring_with_z(self):
+        gdf = GeoDataFrame(geometry=[Point(0, 0, 1), Point(1, 2, 3)])
+        line = point_gdf_to_linestring(gdf, "geometry")
+        assert line.wkt == "LINESTRING Z (0 0 1, 1 2 3)"
+
+    def test_connect_consecutive_points(self):
+        lines = connect_consecutive_points([Point(0, 0), Point(1, 2), Point(3, 4)])
+        assert [line.wkt for line in lines] == [
+            "LINESTRING (0 0, 1 2)",
+            "LINESTRING (1 2, 3 4)",
+        ]
+
+    def test_connect_consecutive_points_with_equal_points(self):
+        lines = connect_consecutive_points([Point(1, 2), Point(1, 2)])
+        assert lines[0].coords[0] == (1, 2)
+        assert lines[0].coords[1] == pytest.approx((1.00000001, 2.00000001))
+
+    def test_convex_hull_of_points(self):
+        points = [Point(0, 0), Point(10, 0), Point(5, 2), Point(10, 10), Point(0, 0)]
+        hull = convex_hull_of_points(points)
+        assert hull.wkt == "POLYGON ((0 0, 10 10, 10 0, 0 0))"
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from movingpandas import _kernels
+from movingpandas.geometry_utils import (
+    R_EARTH,
+    azimuths,
+    calculate_compass_bearings,
+    measure_distances_spherical,
+)
+
+from . import requires_numba, requires_numexpr
+from .test_trajectory import Node, make_traj
+
+
+@requires_numba
+class TestKernels:
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.lon = rng.uniform(-180, 180, 1001)
+        self.lat = rng.uniform(-85, 85, 1001)
+
+    def test_directions_cardinal_directions(self):
+        x, y = np.array([0.0, 10, 0, 0, 0]), np.array([0.0, 0, 0, 10, 0])
+        result = _kernels.directions(x, y, True)
+        assert result == pytest.approx([90, 270, 0, 180])
+
+    def test_directions(self):
+        x, y = self.lon, self.lat
+        result = _kernels.directions(x, y, True)
+        expected = calculate_compass_bearings(x[:-1], y[:-1], x[1:], y[1:])
+        assert result == pytest.approx(expected)
+        result = _kernels.directions(x, y, False)
+        assert result == pytest.approx(azimuths(x[:-1], y[:-1], x[1:], y[1:]))
+
+    def test_compute_directions_dispatch_uses_segment_count(self, monkeypatch):
+        calls = []
+        directions = _kernels.directions
+
+        def spy(*args):
+            calls.append(args)
+            return directions(*args)
+
+        monkeypatch.setattr(_kernels, "directions", spy)
+        traj = make_traj([Node(0, 0), Node(1, 0, second=1), Node(1, 1, second=2)])
+        monkeypatch.setattr(_kernels, "NUMBA_MIN_SIZE", 3)
+        traj.add_direction()
+        assert not calls
+        monkeypatch.setattr(_kernels, "NUMBA_MIN_SIZE", 2)
+        traj.add_direction(overwrite=True)
+        assert len(calls) == 1
+
+    def test_directions_between_equal_points(self):
+        x, y = np.array([1.0, 1, 2]), np.array([0.0, 0, 0])
+        assert _kernels.directions(x, y, True).tolist() == [0, pytest.approx(90)]
+        assert _kernels.directions(x, y, False).tolist() == [0, 90]
+
+    def test_haversine_distances(self, monkeypatch):
+        lon, lat = self.lon, self.lat
+        result = _kernels.haversine_distances(
+            lon[:-1], lat[:-1], lon[1:], lat[1:], R_EARTH
+        )
+        monkeypatch.setattr(_kernels, "HAS_NUMBA", False)
+        expected = measure_distances_spherical(lon[:-1], lat[:-1], lon[1:], lat[1:])
+        assert result == pytest.approx(expected)
+
+
+@requires_numexpr
+class TestNumexprKernels:
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.lon = rng.uniform(-180, 180, 1001)
+        self.lat = rng.uniform(-85, 85, 1001)
+
+    def test_haversine_distances(self, monkeypatch):
+        lon, lat = self.lon, self.lat
+        result = _kernels.haversine_distances_numexpr(
+            lon[:-1], lat[:-1], lon[1:], lat[1:], R_EARTH
+        )
+        monkeypatch.setattr(_kernels, "HAS_NUMBA", False)
+        monkeypatch.setattr(_kernels, "HAS_NUMEXPR", False)
+        expected = measure_distances_spherical(lon[:-1], lat[:-1], lon[1:], lat[1:])
+        assert result == pytest.approx(expected)
+
+    def test_measure_distances_spherical_uses_numexpr(self, monkeypatch):
+        monkeypatch.setattr(_kernels, "HAS_NUMBA", False)
+        monkeypatch.setattr(_kernels, "NUMEXPR_MIN_SIZE", 1)
+        lon, lat = self.lon, self.lat
+        result = measure_distances_spherical(lon[:-1], lat[:-1], lon[1:], lat[1:])
+        expected = _kernels.haversine_distances_numexpr(
+            lon[:-1], lat[:-1], lon[1:], lat[1:], R_EARTH
+        )
+        assert result.tolist() == expected.tolist()
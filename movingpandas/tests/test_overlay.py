@@ -2,10 +2,10 @@
 
 from pytest import approx
 from pandas.testing import assert_frame_equal
-from shapely.geometry import Polygon
+from shapely.geometry import Point, Polygon
 from datetime import datetime, timedelta
 from movingpandas.tests.test_trajectory import Node, make_traj, CRS_METRIC, CRS_LATLON
-from movingpandas.overlay import _get_potentially_intersecting_lines
+from movingpandas.overlay import _get_potentially_intersecting_lines, intersects
 
 
 class TestOverlay:
@@ -41,6 +41,22 @@ class TestOverlay:
             [Node(1, 0, second=1), Node(2, 0, second=2)], id="1_0", parent=traj
         )
 
+    def test_intersects_bbox(self):
+        traj = self.default_traj_metric_5
+        # inside the bounding box, but not touching the trajectory
+        assert not intersects(traj, Polygon([(4, 4), (6, 4), (6, 6), (4, 6)]))
+        # outside the bounding box
+        assert not intersects(traj, Polygon([(20, 0), (30, 0), (30, 5), (20, 5)]))
+        # bounding boxes touch
+        assert intersects(traj, Polygon([(10, 5), (12, 5), (12, 7), (10, 7)]))
+
+    def test_intersects_after_editing_geometry_in_place(self):
+        traj = make_traj(self.nodes[:3], CRS_METRIC)
+        polygon = Polygon([(20, -1), (30, -1), (30, 1), (20, 1)])
+        assert not intersects(traj, polygon)
+        traj.df.loc[traj.get_end_time(), "geometry"] = Point(25, 0)
+        assert intersects(traj, polygon)
+
     def test_get_potentially_intersecting_lines(self):
         polygon = Polygon([(5, -5), (7, -5), (7, 8), (5, 8), (5, -5)])
         traj = self.default_traj_metric_5
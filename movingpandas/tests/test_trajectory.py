@@ -17,6 +17,7 @@ from movingpandas.trajectory import (
     TIMEDELTA_COL_NAME,
     TRAJ_ID_COL_NAME,
 )
+from movingpandas.geometry_utils import measure_distance_spherical
 from movingpandas.unit_utils import MissingCRSWarning
 
 from . import requires_holoviews, has_holoviews
@@ -140,6 +141,10 @@ class TestTrajectory:
             == "LINESTRING M (0.0 0.0 0.0, 6.0 0.0 10.0, 10.0 0.0 20.0)"
         )
 
+    def test_write_linestring_m_wkt_with_subsecond_unix_time(self):
+        traj = make_traj([Node(0, 0, millisec=250000), Node(1.5, 2, second=1)])
+        assert traj.to_linestringm_wkt() == "LINESTRING M (0.0 0.0 0.25, 1.5 2.0 1.0)"
+
     def test_get_position_at_existing_timestamp(self):
         pos = self.default_traj_metric.get_position_at(
             datetime(1970, 1, 1, 0, 0, 10), method="nearest"
@@ -175,6 +180,19 @@ class TestTrajectory:
         )
         assert pos == Point(10, 0)
 
+    def test_get_row_at_previous_and_next_timestamp(self):
+        traj = self.default_traj_metric
+        t = datetime(1970, 1, 1, 0, 0, 14)
+        assert traj.get_row_at(t, "ffill").name == datetime(1970, 1, 1, 0, 0, 10)
+        assert traj.get_row_at(t, "bfill").name == datetime(1970, 1, 1, 0, 0, 20)
+
+    def test_get_row_at_nearest_timestamp_outside_time_range(self):
+        traj = self.default_traj_metric
+        row = traj.get_row_at(datetime(1969, 12, 31, 23, 59, 0), "nearest")
+        assert row.name == traj.get_start_time()
+        row = traj.get_row_at(datetime(1970, 1, 1, 0, 1, 0), "nearest")
+        assert row.name == traj.get_end_time()
+
     def test_get_position_interpolated_at_timestamp_1(self):
         pos = self.default_traj_metric.get_position_at(
             datetime(1970, 1, 1, 0, 0, 14), method="interpolated"
@@ -187,6 +205,17 @@ class TestTrajectory:
         )
         assert pos == Point(6 + 4 / 10 * 5, 0)
 
+    def test_get_position_interpolated_with_z(self):
+        df = pd.DataFrame(
+            [
+                {"geometry": Point(0, 0, 0), "t": datetime(1970, 1, 1, 0, 0, 0)},
+                {"geometry": Point(6, 0, 3), "t": datetime(1970, 1, 1, 0, 0, 10)},
+            ]
+        ).set_index("t")
+        traj = Trajectory(GeoDataFrame(df, crs=CRS_METRIC), 1)
+        pos = traj.get_position_at(datetime(1970, 1, 1, 0, 0, 5))
+        assert pos == Point(3, 0, 1.5)
+
     def test_get_segment_between_existing_timestamps(self):
         segment = self.default_traj_metric_5.get_segment_between(
             datetime(1970, 1, 1, 0, 0, 10), datetime(1970, 1, 1, 0, 0, 30)
@@ -395,6 +424,37 @@ class TestTrajectory:
         traj.add_speed()
         assert traj.df[SPEED_COL_NAME].tolist() == [6.0, 6.0]
 
+    def test_add_speed_keeps_delta_t_column(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1)])
+        traj.df["delta_t"] = [1, 2]
+        traj.add_speed()
+        assert traj.df["delta_t"].tolist() == [1, 2]
+
+    def test_add_speed_does_not_alter_input_df(self):
+        df = pd.DataFrame(
+            [
+                {"geometry": Point(0, 0), "t": datetime(2018, 1, 1, 12, 0, 0)},
+                {"geometry": Point(6, 0), "t": datetime(2018, 1, 1, 12, 0, 1)},
+            ]
+        ).set_index("t")
+        geo_df = GeoDataFrame(df, crs=CRS_METRIC)
+        traj = Trajectory(geo_df, 1)
+        traj.add_speed()
+        traj.add_timedelta()
+        assert traj.df[SPEED_COL_NAME].tolist() == [6.0, 6.0]
+        assert geo_df.columns.tolist() == ["geometry"]
+
+    def test_add_columns_do_not_alter_previous_df(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(18, 0, second=2)])
+        points = traj.to_point_gdf()
+        traj.add_distance()
+        traj.add_speed()
+        traj.add_acceleration()
+        traj.add_timedelta()
+        traj.add_speed(overwrite=True, units=("km", "h"))
+        assert points.columns.tolist() == ["geometry", "value"]
+        assert traj.df[SPEED_COL_NAME].tolist() == pytest.approx([21.6, 21.6, 43.2])
+
     def test_add_speed_with_units(self):
         traj = make_traj([Node(0, 0), Node(6, 0, second=1)])
         traj.add_speed(units=("km", "h"))
@@ -480,6 +540,15 @@ class TestTrajectory:
         traj.add_acceleration()
         assert traj.df[ACCELERATION_COL_NAME].tolist() == [0.0, 0.0, 6.0]
 
+    def test_add_speed_and_acceleration_after_replacing_df(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(18, 0, second=2)])
+        traj.add_speed()
+        traj.df = traj.df.iloc[1:]
+        traj.add_speed(overwrite=True)
+        traj.add_acceleration()
+        assert traj.df[SPEED_COL_NAME].tolist() == [12.0, 12.0]
+        assert traj.df[ACCELERATION_COL_NAME].tolist() == [0.0, 0.0]
+
     def test_add_acceleration_with_distance_units(self):
         traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(18, 0, second=2)])
         traj.add_acceleration(units="km")
@@ -589,6 +658,38 @@ class TestTrajectory:
         traj.add_distance()
         assert traj.df[DISTANCE_COL_NAME].tolist() == [0, 6.0]
 
+    def test_add_distance_haversine(self):
+        traj = make_traj([Node(0, 0), Node(1, 0, second=1)], CRS_LATLON)
+        traj.add_distance(method="haversine")
+        assert traj.df[DISTANCE_COL_NAME].tolist() == [
+            0,
+            measure_distance_spherical(Point(0, 0), Point(1, 0)),
+        ]
+
+    def test_add_kinematics_float32(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(10, 0, second=2)])
+        traj.add_distance(dtype="float32")
+        traj.add_speed(dtype="float32")
+        traj.add_acceleration(dtype="float32")
+        for col in [DISTANCE_COL_NAME, SPEED_COL_NAME, ACCELERATION_COL_NAME]:
+            assert traj.df[col].dtype == "float32"
+        assert traj.df[SPEED_COL_NAME].tolist() == [6.0, 6.0, 4.0]
+        traj.add_speed(overwrite=True)
+        assert traj.df[SPEED_COL_NAME].dtype == "float64"
+
+    def test_add_speed_after_editing_geometry_in_place(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(18, 0, second=2)])
+        traj.add_speed()
+        assert traj.df[SPEED_COL_NAME].tolist() == [6, 6, 12]
+        traj.df.loc[traj.get_end_time(), "geometry"] = Point(100, 0)
+        traj.add_speed(overwrite=True)
+        assert traj.df[SPEED_COL_NAME].tolist() == [6, 6, 94]
+
+    def test_add_distance_invalid_method(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1)])
+        with pytest.raises(ValueError):
+            traj.add_distance(method="xxx")
+
     def test_add_distance_with_units(self):
         traj = make_traj([Node(0, 0), Node(6, 0, second=1)])
         traj.add_distance(units="chain")
@@ -611,6 +712,13 @@ class TestTrajectory:
             0.0037, abs=0.0001
         )
 
+    def test_add_distance_without_crs_with_units_warns_every_time(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1)], crs=None)
+        for _ in range(2):
+            with pytest.warns(MissingCRSWarning):
+                traj.add_distance(units="km", overwrite=True)
+        assert traj.df[DISTANCE_COL_NAME].tolist() == [0, 0.006]
+
     def test_add_distance_can_overwrite(self):
         traj = make_traj([Node(0, 0), Node(6, 0, second=1)])
         traj.add_distance()
@@ -708,6 +816,14 @@ class TestTrajectory:
         result = make_traj([Node(0, 1), Node(6, 5, day=2)], CRS_LATLON).get_bbox()
         assert result == (0, 1, 6, 5)  # (minx, miny, maxx, maxy)
 
+    def test_get_bbox_after_changing_geometries(self):
+        traj = make_traj([Node(0, 1), Node(6, 5, day=2), Node(8, 9, day=3)])
+        assert traj.get_bbox() == (0, 1, 8, 9)
+        traj.df = traj.df.iloc[:2]
+        assert traj.get_bbox() == (0, 1, 6, 5)
+        traj.df.loc[traj.get_end_time(), "geometry"] = Point(100, 0)
+        assert traj.get_bbox() == (0, 0, 100, 1)
+
     def test_get_length_spherical(self):
         result = (
             make_traj([Node(0, 1), Node(6, 0, day=2)], CRS_LATLON).get_length() / 1000
@@ -765,6 +881,25 @@ class TestTrajectory:
         assert traj.get_duration() == timedelta(days=2)
         assert traj.get_start_location() == Point(2, 2)
 
+    def test_start_and_end_time_after_replacing_df(self):
+        traj = self.default_traj_metric_5.copy()
+        assert traj.get_end_time() == datetime(1970, 1, 1, 0, 0, 40)
+        traj.df = traj.df.iloc[1:3]
+        assert traj.get_start_time() == datetime(1970, 1, 1, 0, 0, 10)
+        assert traj.get_end_time() == datetime(1970, 1, 1, 0, 0, 20)
+
+    def test_duplicate_timestamps_keep_first_row(self):
+        traj = make_traj(
+            [
+                Node(0, 0, day=3, value=1),
+                Node(1, 1, day=2, value=2),
+                Node(2, 2, day=2, value=3),
+                Node(3, 3, day=1, value=4),
+            ]
+        )
+        assert traj.df["value"].tolist() == [4, 2, 1]
+        assert traj.df.index.is_monotonic_increasing
+
     def test_plot_exists(self):
         from matplotlib.axes import Axes
 
@@ -806,6 +941,12 @@ class TestTrajectory:
         traj.get_length()
         assert_frame_equal(self.default_traj_metric.df, traj.df)
 
+    def test_getlength_after_replacing_df(self):
+        traj = self.default_traj_metric.copy()
+        assert traj.get_length() == 10
+        traj.df = traj.df.iloc[:2]
+        assert traj.get_length() == 6
+
     def test_str_does_not_alter_df(self):
         traj = self.default_traj_metric.copy()
         str(traj)
@@ -908,6 +1049,14 @@ class TestTrajectory:
         point_gdf = traj.to_point_gdf()
         assert_frame_equal(point_gdf, geo_df)
 
+    def test_eq(self):
+        traj = make_traj([Node(), Node(6, 0, second=6)])
+        assert traj == make_traj([Node(), Node(6, 0, second=6)])
+        assert traj != make_traj([Node(), Node(6, 0, second=6)], id=2)
+        assert traj != make_traj([Node(), Node(6, 1, second=6)])
+        assert traj != make_traj([Node(), Node(6, 0, second=6)], parent=traj)
+        assert traj != None  # noqa: E711
+
     def test_to_line_gdf(self):
         df = pd.DataFrame(
             [
@@ -938,6 +1087,13 @@ class TestTrajectory:
 
         assert_frame_equal(line_gdf, expected_line_gdf)
 
+    def test_to_line_gdf_keeps_attributes(self):
+        traj = make_traj([Node(0, 0, value=1), Node(6, 0, second=6, value=2)])
+        line_gdf = traj.to_line_gdf()
+        assert list(line_gdf.columns) == ["value", "t", "prev_t", "geometry"]
+        assert line_gdf.iloc[0]["value"] == 2
+        assert line_gdf.geometry.iloc[0].wkt == "LINESTRING (0 0, 6 0)"
+
     def test_to_traj_gdf(self):
         df = pd.DataFrame(
             [
@@ -1009,6 +1165,36 @@ class TestTrajectory:
         traj2 = make_traj([Node(2, 0, day=1), Node(2, 4, day=2), Node(3, 4, day=3)])
         assert traj.distance(traj2) == 0
 
+    def test_distance_many(self):
+        traj = make_traj([Node(0, 0, day=1), Node(1, 1, day=2), Node(3, 3, day=3)])
+        traj2 = make_traj([Node(2, 0, day=1), Node(2, 4, day=2), Node(3, 4, day=3)])
+        others = [Point(0, 0), LineString([(2, 4), (3, 4)]), traj2]
+        assert traj.distance_many(others).tolist() == [0, 1, 0]
+        assert traj.distance_many(others, units="km").tolist() == [0, 0.001, 0]
+
+    def test_to_linestring_after_editing_geometry_in_place(self):
+        traj = make_traj([Node(0, 0), Node(1, 1, second=1), Node(3, 3, second=2)])
+        assert traj.to_linestring().wkt == "LINESTRING (0 0, 1 1, 3 3)"
+        traj.df.loc[traj.get_end_time(), "geometry"] = Point(3, 0)
+        assert traj.to_linestring().wkt == "LINESTRING (0 0, 1 1, 3 0)"
+        assert traj.distance(Point(3, 0)) == 0
+
+    def test_get_length_after_editing_geometry_in_place(self):
+        traj = make_traj([Node(0, 0), Node(6, 0, second=1), Node(18, 0, second=2)])
+        assert traj.get_length() == 18
+        traj.df.loc[traj.get_end_time(), "geometry"] = Point(100, 0)
+        assert traj.get_length() == 100
+        traj.df.geometry.values[1] = Point(6, 8)
+        assert traj.get_length() == pytest.approx(10 + 8900**0.5)
+
+    def test_get_t_ns_after_replacing_df(self):
+        traj = make_traj([Node(0, 0), Node(1, 1, second=1), Node(3, 3, second=2)])
+        assert traj._get_t_ns() is traj._get_t_ns()
+        assert traj._get_t_ns().dtype == "int64"
+        assert traj._get_t_ns()[1] - traj._get_t_ns()[0] == 1_000_000_000
+        traj.df = traj.df.iloc[:2]
+        assert len(traj._get_t_ns()) == 2
+
     def test_distance_units(self):
         traj = make_traj([Node(0, 0, day=1), Node(1, 1, day=2), Node(3, 3, day=3)])
         point = Point(0, 0)
@@ -1021,6 +1207,15 @@ class TestTrajectory:
             point = Point(0, 0)
             self.default_traj_latlon.distance(point)
 
+    def test_distance_warning_only_once(self, recwarn):
+        traj = self.default_traj_latlon
+        traj.distance(Point(0, 0))
+        traj.distance(Point(0, 0))
+        traj.hausdorff_distance(Point(0, 0))
+        messages = [str(w.message) for w in recwarn if w.category == UserWarning]
+        assert len([m for m in messages if m.startswith("Distance")]) == 1
+        assert len([m for m in messages if m.startswith("Hausdorff")]) == 1
+
     def test_hausdorff_distance(self):
         from math import sqrt
 
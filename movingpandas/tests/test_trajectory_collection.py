@@ -10,7 +10,11 @@ from datetime import datetime as datetime, timedelta as timedelta
 from copy import copy
 from math import sqrt
 from movingpandas.trajectory_collection import TrajectoryCollection
-from movingpandas.trajectory import TRAJ_ID_COL_NAME
+from movingpandas.trajectory import (
+    ACCELERATION_COL_NAME,
+    SPEED_COL_NAME,
+    TRAJ_ID_COL_NAME,
+)
 
 from . import requires_holoviews
 
@@ -235,6 +239,25 @@ class TestTrajectoryCollection:
         with pytest.raises(RuntimeError):
             collection.add_traj_id()
 
+    def test_add_speed_and_acceleration_multiprocessing(self):
+        expected = self.collection.copy()
+        expected.add_speed()
+        expected.add_acceleration()
+        points = self.collection.trajectories[0].df
+        columns = points.columns.tolist()
+        self.collection.add_speed(n_threads=2)
+        self.collection.add_acceleration(n_threads=2)
+        for traj, expected_traj in zip(self.collection, expected):
+            assert_frame_equal(traj.df, expected_traj.df)
+            assert traj.get_speed_column_name() == SPEED_COL_NAME
+        assert ACCELERATION_COL_NAME in self.collection.trajectories[0].df.columns
+        assert points.columns.tolist() == columns
+
+    def test_add_speed_multiprocessing_overwrite_raises_error(self):
+        self.collection.add_speed()
+        with pytest.raises(RuntimeError):
+            self.collection.add_speed(n_threads=2)
+
     def test_to_point_gdf(self):
         point_gdf = self.collection.to_point_gdf()
         point_gdf.to_file("temp.gpkg", layer="points", driver="GPKG")
@@ -97,6 +97,8 @@ def _get_deps_info():
         "matplotlib",
         "mapclassify",
         "geopy",
+        "numba",
+        "numexpr",
         "holoviews",
         "hvplot",
         "geoviews",
@@ -2,12 +2,11 @@
 
 import warnings
 
-from shapely.affinity import translate
-from shapely.geometry import Point, LineString
-from pandas import DataFrame, to_datetime, Series
+import numpy as np
+from shapely.geometry import Point
+from pandas import DataFrame, Series, Timedelta, Timestamp, to_datetime
 from pandas.core.indexes.datetimes import DatetimeIndex
 from geopandas import GeoDataFrame
-from geopy.distance import geodesic
 
 try:
     from pyproj import CRS
@@ -15,20 +14,29 @@ except ImportError:
     # TODO: fiona.crs is deprecated from fiona 2.0, use fiona.CRS instead
     from fiona.crs import from_epsg
 
+from . import _kernels
 from .overlay import clip, intersection, intersects, create_entry_and_exit_points
 from .time_range_utils import SpatioTemporalRange
 from .geometry_utils import (
-    angular_difference,
+    angular_differences,
     azimuth,
+    azimuths,
+    calculate_compass_bearings,
     calculate_initial_compass_bearing,
-    measure_distance_geodesic,
-    measure_distance_euclidean,
+    connect_consecutive_points,
+    convex_hull_of_points,
+    get_point_coordinates,
+    measure_distances_geodesic,
+    measure_distances_euclidean,
+    measure_distances_to,
+    measure_distances_spherical,
+    measure_length_geodesic,
     point_gdf_to_linestring,
 )
 from .unit_utils import (
     UNITS,
     MissingCRSWarning,
-    to_unixtime,
+    to_unixtimes,
     get_conversion,
 )
 from .trajectory_plotter import _TrajectoryPlotter
@@ -45,6 +53,9 @@ SPEED_COL_NAME = "speed"
 TIMEDELTA_COL_NAME = "timedelta"
 TRAJ_ID_COL_NAME = "traj_id"
 
+_ONE_SECOND = Timedelta(seconds=1)
+_ONE_MINUTE = Timedelta(minutes=1)
+
 
 class TimeZoneWarning(UserWarning, ValueError):
     pass
@@ -145,8 +156,17 @@ class Trajectory:
 
         self.id = traj_id
         self.obj_id = obj_id
-        df.sort_index(inplace=True)
-        self.df = df[~df.index.duplicated(keep="first")]
+        self._time_range = None
+        self._time_range_index = None
+        self._t_ns = None
+        self._t_ns_index = None
+        self._euclidean_warnings = set()
+        # sort by time and keep the first row of duplicate timestamps
+        ts = df.index.values
+        if df.index.is_monotonic_increasing:
+            self.df = df[np.concatenate([[True], ts[1:] != ts[:-1]])]
+        else:
+            self.df = df.iloc[np.unique(ts, return_index=True)[1]]
         self.crs = df.crs
         self.parent = parent
         if self.crs is not None:
@@ -192,11 +212,31 @@ class Trajectory:
 
     def __eq__(self, other):
         # TODO: make bullet proof
-        return (
-            str(self) == str(other)
-            and self.crs == other.crs
-            and self.parent == other.parent
-        )
+        if not isinstance(other, Trajectory):
+            return False
+        # cheap checks first to avoid building string representations
+        if (
+            self.id != other.id
+            or self.size() != other.size()
+            or self.crs != other.crs
+            or self.get_start_time() != other.get_start_time()
+            or self.get_end_time() != other.get_end_time()
+            or self.parent != other.parent
+        ):
+            return False
+        return self.df.equals(other.df) or self.is_same_trajectory(other)
+
+    def is_same_trajectory(self, other):
+        """
+        Return whether the string representations of both trajectories match,
+        i.e. whether they have the same id, time range, size, length, bounds,
+        and geometry WKT (first 100 characters).
+
+        Returns
+        -------
+        bool
+        """
+        return str(self) == str(other)
 
     def size(self):
         """
@@ -388,6 +428,37 @@ class Trajectory:
         """
         return self.df.geometry.name
 
+    def _get_xy(self):
+        """
+        Return the x and y coordinates of the trajectory's points as two
+        contiguous float64 arrays.
+        """
+        xy = get_point_coordinates(self.df.geometry.values)
+        return np.ascontiguousarray(xy[:, 0]), np.ascontiguousarray(xy[:, 1])
+
+    def _get_bounds(self):
+        """
+        Return the bounding box (minx, miny, maxx, maxy) of the trajectory's
+        points.
+        """
+        x, y = self._get_xy()
+        return (float(x.min()), float(y.min()), float(x.max()), float(y.max()))
+
+    def _get_t_ns(self):
+        """
+        Return the timestamps of the trajectory's points as contiguous int64
+        array of nanoseconds.
+
+        The array is cached until the index of the trajectory's DataFrame has
+        been replaced.
+        """
+        index = self.df.index
+        if self._t_ns_index is not index:
+            t_ns = index.values.astype("datetime64[ns]").view(np.int64)
+            self._t_ns = np.ascontiguousarray(t_ns)
+            self._t_ns_index = index
+        return self._t_ns
+
     def to_linestring(self):
         """
         Return trajectory geometry as LineString.
@@ -411,12 +482,12 @@ class Trajectory:
             WKT of trajectory as LineStringM
         """
         # Shapely only supports x, y, z. Therefore, this is a bit hacky!
-        coords = ""
-        for index, row in self.df.iterrows():
-            pt = row[self.get_geom_column_name()]
-            t = to_unixtime(index)
-            coords += "{} {} {}, ".format(pt.x, pt.y, t)
-        wkt = "LINESTRING M ({})".format(coords[:-2])
+        x, y = self._get_xy()
+        ts = to_unixtimes(self.df.index)
+        coords = ", ".join(
+            f"{x} {y} {t}" for x, y, t in zip(x.tolist(), y.tolist(), ts.tolist())
+        )
+        wkt = "LINESTRING M ({})".format(coords)
         return wkt
 
     def to_point_gdf(self, return_orig_tz=False):
@@ -444,12 +515,12 @@ class Trajectory:
         -------
         GeoDataFrame
         """
-        line_gdf = self._to_line_df()
-        line_gdf.drop(columns=[self.get_geom_column_name(), "prev_pt"], inplace=True)
-        line_gdf.reset_index(drop=True, inplace=True)
-        line_gdf.rename(columns={"line": "geometry"}, inplace=True)
-        line_gdf.set_geometry("geometry", inplace=True)
-        return line_gdf
+        line_df = DataFrame(self.df.drop(columns=[self.get_geom_column_name()]))[1:]
+        line_df.reset_index(drop=True, inplace=True)
+        line_df["t"] = self.df.index[1:]
+        line_df["prev_t"] = self.df.index[:-1]
+        lines = connect_consecutive_points(self.df.geometry.values)
+        return GeoDataFrame(line_df, geometry=lines, crs=self.df.crs)
 
     def to_traj_gdf(self, wkt=False, agg=False):
         """
@@ -490,15 +561,15 @@ class Trajectory:
             for col, agg_modes in agg.items():
                 if type(agg_modes) != list:
                     agg_modes = [agg_modes]
+                values = self.df[col]
                 for agg_mode in agg_modes:
+                    percent = int(agg_mode[1:]) if agg_mode[0] == "q" else None
                     if agg_mode == "mode":
-                        aggregated = self.df.agg({col: Series.mode})[col][0]
-                    elif agg_mode[0] == "q" and int(agg_mode[1:]) < 100:
-                        aggregated = self.df[col].agg(
-                            lambda x: x.quantile(int(agg_mode[1:]) / 100)
-                        )
+                        aggregated = values.mode().iloc[0]
+                    elif percent is not None and percent < 100:
+                        aggregated = values.quantile(percent / 100)
                     else:
-                        aggregated = self.df.agg({col: agg_mode})[col]
+                        aggregated = values.agg(agg_mode)
                     properties[f"{col}_{agg_mode}"] = aggregated
         df = DataFrame([properties])
         traj_gdf = GeoDataFrame(df, crs=self.crs)
@@ -534,7 +605,7 @@ class Trajectory:
         tuple
             Bounding box values (minx, miny, maxx, maxy)
         """
-        return tuple(self.df.total_bounds.tolist())  # (minx, miny, maxx, maxy)
+        return self._get_bounds()
 
     def get_start_time(self):
         """
@@ -545,7 +616,7 @@ class Trajectory:
         datetime.datetime
             Trajectory start time
         """
-        return self.df.index.min().to_pydatetime()
+        return self._get_time_range()[0]
 
     def get_end_time(self):
         """
@@ -556,7 +627,23 @@ class Trajectory:
         datetime.datetime
             Trajectory end time
         """
-        return self.df.index.max().to_pydatetime()
+        return self._get_time_range()[1]
+
+    def _get_time_range(self):
+        """
+        Return the trajectory's start and end time.
+
+        The values are cached until the index of the trajectory's DataFrame
+        has been replaced.
+        """
+        index = self.df.index
+        if self._time_range_index is not index:
+            self._time_range = (
+                index.min().to_pydatetime(),
+                index.max().to_pydatetime(),
+            )
+            self._time_range_index = index
+        return self._time_range
 
     def get_duration(self):
         """
@@ -588,9 +675,33 @@ class Trajectory:
         try:
             return self.df.loc[t]
         except KeyError:
-            index = self.df.index.sort_values().drop_duplicates()
-            idx = index.get_indexer([t], method=method)[0]
-            return self.df.iloc[idx]
+            index = self.df.index
+            if not index.is_monotonic_increasing or not index.is_unique:
+                index = index.sort_values().drop_duplicates()
+                idx = index.get_indexer([t], method=method)[0]
+                return self.df.iloc[idx]
+            return self.df.iloc[self._get_position_at(t, method)]
+
+    def _get_position_at(self, t, method):
+        """
+        Return the position of the row at time t in the sorted and unique
+        index, using binary search instead of Pandas' get_indexer.
+        """
+        index = self.df.index
+        t = Timestamp(t)
+        pos = index.searchsorted(t)  # first position with timestamp >= t
+        if method in ("ffill", "pad"):
+            return pos - 1  # -1 if t is before the start, as with get_indexer
+        if method in ("bfill", "backfill"):
+            return pos if pos < len(index) else -1
+        if method == "nearest":
+            if pos == 0:
+                return 0
+            if pos == len(index):
+                return pos - 1
+            # ties are resolved towards the later row, as with get_indexer
+            return pos - 1 if t - index[pos - 1] < index[pos] - t else pos
+        raise ValueError(f"Invalid method {method}!")
 
     def interpolate_position_at(self, t):
         """
@@ -610,16 +721,16 @@ class Trajectory:
         next_row = self.get_row_at(t, "bfill")
         t_diff = next_row.name - prev_row.name
         t_diff_at = t - prev_row.name
-        line = LineString(
-            [
-                prev_row[self.get_geom_column_name()],
-                next_row[self.get_geom_column_name()],
-            ]
+        geom_col = self.get_geom_column_name()
+        pt0 = prev_row[geom_col]
+        pt1 = next_row[geom_col]
+        if t_diff == 0 or pt0 == pt1:
+            return pt0
+        # linear interpolation between the two positions, no need for a LineString
+        ratio = t_diff_at / t_diff
+        return Point(
+            [c0 + ratio * (c1 - c0) for c0, c1 in zip(pt0.coords[0], pt1.coords[0])]
         )
-        if t_diff == 0 or line.length == 0:
-            return prev_row[self.get_geom_column_name()]
-        interpolated_position = line.interpolate(t_diff_at / t_diff * line.length)
-        return interpolated_position
 
     def get_position_at(self, t, method="interpolated"):
         """
@@ -742,36 +853,54 @@ class Trajectory:
             )
         return segment
 
-    def _compute_distance(self, row, conversion):
-        pt0 = row["prev_pt"]
-        pt1 = row[self.get_geom_column_name()]
-        if not isinstance(pt0, Point):
-            return 0.0
-        if not isinstance(pt1, Point):
-            raise ValueError("Invalid trajectory! Got {} instead of point!".format(pt1))
-        if pt0 == pt1:
-            return 0.0
-        if self.is_latlon:
-            dist_computed = (
-                measure_distance_geodesic(pt0, pt1)
-                * conversion.crs
-                / conversion.distance
+    def _compute_distances(self, method="geodesic"):
+        """
+        Return the distances between consecutive positions.
+        """
+        if method not in ("geodesic", "haversine"):
+            raise ValueError(
+                f"Invalid method {method}. Must be one of [geodesic, haversine]"
             )
+        x, y = self._get_xy()
+        x0, y0, x1, y1 = x[:-1], y[:-1], x[1:], y[1:]
+        if self.is_latlon and method == "haversine":
+            dist_computed = measure_distances_spherical(x0, y0, x1, y1)
+        elif self.is_latlon:
+            dist_computed = measure_distances_geodesic(x0, y0, x1, y1)
         else:  # The following distance will be in CRS units that might not be meters!
-            dist_computed = (
-                measure_distance_euclidean(pt0, pt1)
-                * conversion.crs
-                / conversion.distance
-            )
+            dist_computed = measure_distances_euclidean(x0, y0, x1, y1)
         return dist_computed
 
-    def _add_prev_pt(self, force=True):
+    def _compute_delta_t(self):
+        """
+        Return the time differences between consecutive positions in seconds.
+        """
+        return np.diff(self._get_t_ns()) / 1e9
+
+    def _compute_speeds(self, conversion, method, delta_t):
+        """
+        Return the speeds at the trajectory's positions, given the time
+        differences between consecutive positions in seconds.
+
+        The speed in the first row equals that of the second row.
         """
-        Create a shifted geometry column with previous positions.
+        speeds = self._compute_distances(method) / delta_t
+        scale = conversion.crs / conversion.distance * conversion.time
+        if scale != 1.0:
+            speeds *= scale
+        return np.concatenate([speeds[:1], speeds])
+
+    def _compute_accelerations(self, conversion, method):
+        """
+        Return the accelerations at the trajectory's positions, reusing the
+        time differences for the speeds they are derived from.
+
+        The acceleration in the first row equals that of the second row.
         """
-        if "prev_pt" not in self.df.columns or force:
-            # TODO: decide on default enforcement behavior
-            self.df = self.df.assign(prev_pt=self.df.geometry.shift())
+        delta_t = self._compute_delta_t()
+        speeds = self._compute_speeds(conversion, method, delta_t)
+        accelerations = np.diff(speeds) / delta_t * conversion.time2
+        return np.concatenate([accelerations[:1], accelerations])
 
     def get_length(self, units=UNITS()):
         """
@@ -841,11 +970,13 @@ class Trajectory:
         float
             Length of the trajectory
         """
-        pt_tuples = [(pt.y, pt.x) for pt in self.df.geometry.tolist()]
+        x, y = self._get_xy()
         if self.is_latlon:
-            length = geodesic(*pt_tuples).m
+            length = measure_length_geodesic(x, y)
         else:  # The following distance will be in CRS units that might not be meters!
-            length = LineString(pt_tuples).length
+            length = float(
+                measure_distances_euclidean(x[:-1], y[:-1], x[1:], y[1:]).sum()
+            )
 
         conversion = get_conversion(units, self.crs_units)
 
@@ -886,62 +1017,22 @@ class Trajectory:
         if hasattr(self, "timedelta_col_name"):
             if self.timedelta_col_name in self.df.columns:
                 return self.df[self.timedelta_col_name].median()
-        return self._get_df_with_timedelta()[TIMEDELTA_COL_NAME].median()
-
-    def _compute_heading(self, row):
-        pt0 = row["prev_pt"]
-        pt1 = row[self.get_geom_column_name()]
-        if not isinstance(pt0, Point):
-            return 0.0
-        if pt0 == pt1:
-            return 0.0
-        if self.is_latlon:
-            return calculate_initial_compass_bearing(pt0, pt1)
-        else:
-            return azimuth(pt0, pt1)
+        return self._compute_timedeltas().median()
 
-    def _compute_angular_difference(self, row):
-        degrees1 = row["prev_direction"]
-        degrees2 = row["direction"]
-        if degrees1 == degrees2:
-            return 0.0
-        else:
-            return angular_difference(degrees1, degrees2)
-
-    def _compute_speed(self, row, conversion):
-        pt0 = row["prev_pt"]
-        pt1 = row[self.get_geom_column_name()]
-        if not isinstance(pt0, Point):
-            return 0.0
-        if not isinstance(pt1, Point):
-            raise ValueError("Invalid trajectory! Got {} instead of point!".format(pt1))
-        if pt0 == pt1:
-            return 0.0
+    def _compute_directions(self):
+        """
+        Return the directions between consecutive positions.
+        """
+        x, y = self._get_xy()
+        if _kernels.HAS_NUMBA and len(x) - 1 >= _kernels.NUMBA_MIN_SIZE:
+            return _kernels.directions(x, y, self.is_latlon)
+        x0, y0, x1, y1 = x[:-1], y[:-1], x[1:], y[1:]
         if self.is_latlon:
-            dist_computed = (
-                measure_distance_geodesic(pt0, pt1)
-                * conversion.crs
-                / conversion.distance
-            )
-        else:  # The following distance will be in CRS units that might not be meters!
-            dist_computed = (
-                measure_distance_euclidean(pt0, pt1)
-                * conversion.crs
-                / conversion.distance
-            )
-        return dist_computed / row["delta_t"].total_seconds() * conversion.time
-
-    def _connect_prev_pt_and_geometry(self, row):
-        pt0 = row["prev_pt"]
-        pt1 = row[self.get_geom_column_name()]
-        if not isinstance(pt0, Point):
-            return None
-        if not isinstance(pt1, Point):
-            raise ValueError("Invalid trajectory! Got {} instead of point!".format(pt1))
-        if pt0 == pt1:
-            # to avoid intersection issues with zero length lines
-            pt1 = translate(pt1, 0.00000001, 0.00000001)
-        return LineString(list(pt0.coords) + list(pt1.coords))
+            directions = calculate_compass_bearings(x0, y0, x1, y1)
+        else:
+            directions = azimuths(x0, y0, x1, y1)
+        directions[(x0 == x1) & (y0 == y1)] = 0.0
+        return directions
 
     def add_traj_id(self, overwrite=False):
         """
@@ -979,11 +1070,9 @@ class Trajectory:
                 "Use overwrite=True to overwrite exiting values or update the "
                 "name arg."
             )
-        self._add_prev_pt()
-        self.df[name] = self.df.apply(self._compute_heading, axis=1)
+        directions = self._compute_directions()
         # set the direction in the first row to the direction of the second row
-        self.df.at[self.get_start_time(), name] = self.df.iloc[1][name]
-        self.df.drop(columns=["prev_pt"], inplace=True)
+        self.df[name] = np.concatenate([directions[:1], directions])
 
     def add_angular_difference(
         self,
@@ -1008,23 +1097,23 @@ class Trajectory:
         # Avoid computing direction again if already computed
         direction_column_name = self.get_direction_column_name()
         if direction_column_name in self.df.columns:
-            direction_exists = True
-            temp_df = self.df.copy()
+            directions = self.df[direction_column_name].to_numpy(dtype=float)
         else:
-            direction_exists = False
-            self.add_direction(name=DIRECTION_COL_NAME)
-            temp_df = self.df.copy()
-
-        temp_df["prev_" + direction_column_name] = temp_df[
-            direction_column_name
-        ].shift()
-        self.df[name] = temp_df.apply(self._compute_angular_difference, axis=1)
+            # same values as add_direction, without adding a temporary column
+            directions = self._compute_directions()
+            directions = np.concatenate([directions[:1], directions])
+        differences = angular_differences(directions[:-1], directions[1:])
         # set the first row to be 0
-        self.df.at[self.get_start_time(), name] = 0.0
-        if not direction_exists:
-            self.df.drop(columns=[DIRECTION_COL_NAME], inplace=True)
+        self.df[name] = np.concatenate([[0.0], differences])
 
-    def add_distance(self, overwrite=False, name=DISTANCE_COL_NAME, units=None):
+    def add_distance(
+        self,
+        overwrite=False,
+        name=DISTANCE_COL_NAME,
+        units=None,
+        method="geodesic",
+        dtype="float64",
+    ):
         """
         Add distance column and values to the trajectory's DataFrame.
 
@@ -1091,6 +1180,13 @@ class Trajectory:
                 "indian_ft_1962": Indian Foot 1962
                 "indian_ft_1975": Indian Foot 1975
 
+        method : str
+            Distance calculation for geographic projections: "geodesic" on the
+            WGS84 ellipsoid (default) or the faster, spherical "haversine"
+        dtype : str or numpy.dtype
+            Data type of the new column (default: "float64"). "float32" halves
+            the memory use at the cost of precision (about 7 significant digits)
+
         Examples
         ----------
         If no units are declared, the distance will be calculated
@@ -1123,9 +1219,16 @@ class Trajectory:
                 "name arg."
             )
         conversion = get_conversion(units, self.crs_units)
-        self.df = self._get_df_with_distance(conversion, name)
+        self.df = self._get_df_with_distance(conversion, name, method, dtype)
 
-    def add_speed(self, overwrite=False, name=SPEED_COL_NAME, units=UNITS()):
+    def add_speed(
+        self,
+        overwrite=False,
+        name=SPEED_COL_NAME,
+        units=UNITS(),
+        method="geodesic",
+        dtype="float64",
+    ):
         """
         Add speed column and values to the trajectory's DataFrame.
 
@@ -1207,6 +1310,13 @@ class Trajectory:
                 "d": days
                 "a": years
 
+        method : str
+            Distance calculation for geographic projections: "geodesic" on the
+            WGS84 ellipsoid (default) or the faster, spherical "haversine"
+        dtype : str or numpy.dtype
+            Data type of the new column (default: "float64"). "float32" halves
+            the memory use at the cost of precision (about 7 significant digits)
+
         Examples
         ----------
         If no units are declared, the speed will be calculated
@@ -1239,10 +1349,15 @@ class Trajectory:
                 f"name arg."
             )
         conversion = get_conversion(units, self.crs_units)
-        self.df = self._get_df_with_speed(conversion, name)
+        self.df = self._get_df_with_speed(conversion, name, method, dtype)
 
     def add_acceleration(
-        self, overwrite=False, name=ACCELERATION_COL_NAME, units=UNITS()
+        self,
+        overwrite=False,
+        name=ACCELERATION_COL_NAME,
+        units=UNITS(),
+        method="geodesic",
+        dtype="float64",
     ):
         """
         Add acceleration column and values to the trajectory's DataFrame.
@@ -1331,6 +1446,13 @@ class Trajectory:
                 "d": days
                 "a": years
 
+        method : str
+            Distance calculation for geographic projections: "geodesic" on the
+            WGS84 ellipsoid (default) or the faster, spherical "haversine"
+        dtype : str or numpy.dtype
+            Data type of the new column (default: "float64"). "float32" halves
+            the memory use at the cost of precision (about 7 significant digits)
+
         Examples
         ----------
         If no units are declared, the acceleration will be calculated
@@ -1363,7 +1485,7 @@ class Trajectory:
                 f"name arg."
             )
         conversion = get_conversion(units, self.crs_units)
-        self.df = self._get_df_with_acceleration(conversion, name)
+        self.df = self._get_df_with_acceleration(conversion, name, method, dtype)
 
     def add_timedelta(self, overwrite=False, name=TIMEDELTA_COL_NAME):
         """
@@ -1388,51 +1510,46 @@ class Trajectory:
             )
         self.df = self._get_df_with_timedelta(name)
 
+    def _compute_timedeltas(self):
+        """
+        Return the time differences to the previous rows as Series.
+        """
+        times = self.df.index.values
+        deltas = np.concatenate([[np.timedelta64("NaT")], np.diff(times)])
+        return Series(deltas, index=self.df.index)
+
+    def _get_df_with_column(self, name, values):
+        """
+        Return a shallow copy of the trajectory's DataFrame with the given
+        column added, leaving the trajectory's DataFrame unchanged.
+        """
+        df = self.df.copy(deep=False)
+        df[name] = values
+        return df
+
     def _get_df_with_timedelta(self, name=TIMEDELTA_COL_NAME):
-        temp_df = self.df.copy()
-        times = Series(index=temp_df.index, data=temp_df.index)
-        temp_df[name] = times.diff().values
-        return temp_df
-
-    def _get_df_with_distance(self, conversion, name=DISTANCE_COL_NAME):
-        temp_df = self.df.copy()
-        temp_df = temp_df.assign(prev_pt=temp_df.geometry.shift())
-        try:
-            temp_df[name] = temp_df.apply(
-                self._compute_distance, conversion=conversion, axis=1
-            )
-        except ValueError as e:
-            raise e
-        # set the distance in the first row to zero
-        temp_df.at[self.get_start_time(), name] = 0
-        temp_df = temp_df.drop(columns=["prev_pt"])
-        return temp_df
-
-    def _get_df_with_speed(self, conversion, name=SPEED_COL_NAME):
-        temp_df = self._get_df_with_timedelta(name="delta_t")
-        temp_df = temp_df.assign(prev_pt=temp_df.geometry.shift())
-        try:
-            temp_df[name] = temp_df.apply(
-                self._compute_speed, conversion=conversion, axis=1
-            )
-        except ValueError as e:
-            raise e
-        # set the speed in the first row to the speed of the second row
-        temp_df.at[self.get_start_time(), name] = temp_df.iloc[1][name]
-        temp_df = temp_df.drop(columns=["prev_pt", "delta_t"])
-        return temp_df
-
-    def _get_df_with_acceleration(self, conversion, name=ACCELERATION_COL_NAME):
-        temp_df = self._get_df_with_speed(conversion, name="speed_temp")
-        temp_df[name] = (
-            temp_df["speed_temp"].diff()
-            / temp_df.index.to_series().diff().dt.total_seconds()
-            * conversion.time2
+        return self._get_df_with_column(name, self._compute_timedeltas().values)
+
+    def _get_df_with_distance(
+        self, conversion, name=DISTANCE_COL_NAME, method="geodesic", dtype="float64"
+    ):
+        distances = self._compute_distances(method)
+        distances = np.concatenate(
+            [[0.0], distances * (conversion.crs / conversion.distance)]
         )
-        # set the acceleration in the first row to the acceleration of the
-        # second row
-        temp_df.at[self.get_start_time(), name] = temp_df.iloc[1][name]
-        return temp_df.drop(columns=["speed_temp"])
+        return self._get_df_with_column(name, distances.astype(dtype, copy=False))
+
+    def _get_df_with_speed(
+        self, conversion, name=SPEED_COL_NAME, method="geodesic", dtype="float64"
+    ):
+        speeds = self._compute_speeds(conversion, method, self._compute_delta_t())
+        return self._get_df_with_column(name, speeds.astype(dtype, copy=False))
+
+    def _get_df_with_acceleration(
+        self, conversion, name=ACCELERATION_COL_NAME, method="geodesic", dtype="float64"
+    ):
+        accelerations = self._compute_accelerations(conversion, method)
+        return self._get_df_with_column(name, accelerations.astype(dtype, copy=False))
 
     def intersects(self, polygon):
         """
@@ -1519,11 +1636,7 @@ class Trajectory:
             Distance
         """
         if self.is_latlon:
-            message = (
-                f"Distance is computed using Euclidean geometry but "
-                f"the trajectory coordinate system is {self.crs}."
-            )
-            warnings.warn(message, UserWarning)
+            self._warn_euclidean("Distance")
         if type(other) == Trajectory:
             other = other.to_linestring()
 
@@ -1531,6 +1644,48 @@ class Trajectory:
         conversion = get_conversion(units, self.crs_units)
         return dist / conversion.distance
 
+    def distance_many(self, others, units=UNITS()):
+        """
+        Return the minimum distances to the other geometric objects or
+        trajectories, computed in one vectorized call.
+
+        Parameters
+        ----------
+        others : list of shapely.geometry or Trajectory
+            Other geometric objects or trajectories
+        units : str
+            Units in which to calculate distance values (default: CRS units),
+            see distance() for the allowed units
+
+        Returns
+        -------
+        numpy.ndarray
+            Distances
+        """
+        if self.is_latlon:
+            self._warn_euclidean("Distance")
+        geometries = [
+            other.to_linestring() if type(other) == Trajectory else other
+            for other in others
+        ]
+        dist = measure_distances_to(self.to_linestring(), geometries)
+        conversion = get_conversion(units, self.crs_units)
+        return dist / conversion.distance
+
+    def _warn_euclidean(self, measure):
+        """
+        Warn that the measure is computed using Euclidean geometry, only once
+        per trajectory and measure to keep repeated calls cheap.
+        """
+        if measure in self._euclidean_warnings:
+            return
+        self._euclidean_warnings.add(measure)
+        message = (
+            f"{measure} is computed using Euclidean geometry but "
+            f"the trajectory coordinate system is {self.crs}."
+        )
+        warnings.warn(message, UserWarning)
+
     def hausdorff_distance(self, other, units=UNITS()):
         """
         Return the Hausdorff distance to the other geometric object (based on shapely
@@ -1604,11 +1759,7 @@ class Trajectory:
             Hausdorff distance
         """
         if self.is_latlon:
-            message = (
-                f"Hausdorff distance is computed using Euclidean geometry but "
-                f"the trajectory coordinate system is {self.crs}."
-            )
-            warnings.warn(message, UserWarning)
+            self._warn_euclidean("Hausdorff distance")
         if type(other) == Trajectory:
             other = other.to_linestring()
         dist = self.to_linestring().hausdorff_distance(other)
@@ -1678,7 +1829,7 @@ class Trajectory:
         offset : int
             Number of seconds to shift by, can be positive or negative
         """
-        self.df[column] = self.df[column].shift(offset, freq="1s")
+        self.df[column] = self.df[column].shift(offset, freq=_ONE_SECOND)
 
     def apply_offset_minutes(self, column, offset):
         """
@@ -1691,7 +1842,7 @@ class Trajectory:
         offset : int
             Number of minutes to shift by, can be positive or negative
         """
-        self.df[column] = self.df[column].shift(offset, freq="1min")
+        self.df[column] = self.df[column].shift(offset, freq=_ONE_MINUTE)
 
     def _to_line_df(self):
         """
@@ -1703,13 +1854,11 @@ class Trajectory:
         line_df : GeoDataFrame
             GeoDataFrame of line segments
         """
-        line_df = self.df.copy()
-        line_df["prev_pt"] = line_df.geometry.shift()
-        line_df["t"] = self.df.index
-        line_df["prev_t"] = line_df["t"].shift()
-        line_df["line"] = line_df.apply(self._connect_prev_pt_and_geometry, axis=1)
-        line_df = line_df.set_geometry("line")[1:]
-        return line_df
+        line_df = self.df.iloc[1:].copy()
+        line_df["t"] = self.df.index[1:]
+        line_df["prev_t"] = self.df.index[:-1]
+        line_df["line"] = connect_consecutive_points(self.df.geometry.values)
+        return line_df.set_geometry("line")
 
     def get_mcp(self):
         """Return the Minimum Convex Polygon of the trajectory data
@@ -1720,4 +1869,6 @@ class Trajectory:
             The polygon or line (in case of only two points)
             of the Minimum Convex Polygon
         """
-        return self.df.geometry.unary_union.convex_hull
+        if len(self.df) < 3:
+            return self.df.geometry.unary_union.convex_hull
+        return convex_hull_of_points(self.df.geometry.values)
@@ -2,8 +2,10 @@
 
 from pandas import concat
 from copy import copy
+from itertools import repeat
+from multiprocessing import Pool
 from geopandas import GeoDataFrame
-from .trajectory import Trajectory
+from .trajectory import Trajectory, ACCELERATION_COL_NAME, SPEED_COL_NAME
 from .trajectory_plotter import _TrajectoryCollectionPlotter
 
 
@@ -375,7 +377,7 @@ class TrajectoryCollection:
         result.trajectories = filtered
         return result
 
-    def add_speed(self, overwrite=False):
+    def add_speed(self, overwrite=False, n_threads=1):
         """
         Add speed column and values to the trajectories.
 
@@ -386,7 +388,15 @@ class TrajectoryCollection:
         ----------
         overwrite : bool
             Whether to overwrite existing speed values (default: False)
+        n_threads : int
+            Number of processes computing trajectories in parallel
+            (default: 1)
         """
+        if n_threads > 1:
+            self._add_column_multiprocessing(
+                "add_speed", "speed_col_name", SPEED_COL_NAME, overwrite, n_threads
+            )
+            return
         for traj in self:
             traj.add_speed(overwrite)
 
@@ -421,7 +431,7 @@ class TrajectoryCollection:
         for traj in self:
             traj.add_angular_difference(overwrite)
 
-    def add_acceleration(self, overwrite=False):
+    def add_acceleration(self, overwrite=False, n_threads=1):
         """
         Add acceleration column and values to the trajectories.
 
@@ -433,10 +443,43 @@ class TrajectoryCollection:
         ----------
         overwrite : bool
             Whether to overwrite existing acceleration values (default: False)
-        """
+        n_threads : int
+            Number of processes computing trajectories in parallel
+            (default: 1)
+        """
+        if n_threads > 1:
+            self._add_column_multiprocessing(
+                "add_acceleration",
+                "acceleration_col_name",
+                ACCELERATION_COL_NAME,
+                overwrite,
+                n_threads,
+            )
+            return
         for traj in self:
             traj.add_acceleration(overwrite)
 
+    def _add_column_multiprocessing(
+        self, method_name, attr_name, column, overwrite, n_threads
+    ):
+        """
+        Run the Trajectory add method in worker processes and only send the
+        computed column values back.
+        """
+        with Pool(n_threads) as p:
+            results = p.starmap(
+                _get_added_column,
+                zip(
+                    self.trajectories,
+                    repeat(method_name),
+                    repeat(column),
+                    repeat(overwrite),
+                ),
+            )
+        for traj, values in zip(self.trajectories, results):
+            traj.df = traj._get_df_with_column(column, values)
+            setattr(traj, attr_name, column)
+
     def add_traj_id(self, overwrite=False):
         """
         Add trajectory id column and values to the trajectories.
@@ -534,3 +577,13 @@ def _get_location_at(traj, t, columns=None):
                 column
             ]
     return loc
+
+
+def _get_added_column(traj, method_name, column, overwrite):
+    """
+    Call the add method (e.g. add_speed) on the trajectory and return the
+    values of the added column. Used by the worker processes of
+    TrajectoryCollection.
+    """
+    getattr(traj, method_name)(overwrite)
+    return traj.df[column].values
@@ -78,13 +78,12 @@ class MinDistanceGeneralizer(TrajectoryGeneralizer):
     """
 
     def _generalize_traj(self, traj, tolerance):
-        temp_df = traj.df.copy()
-        prev_pt = temp_df.iloc[0][traj.get_geom_column_name()]
+        geom_col = traj.get_geom_column_name()
+        prev_pt = traj.df[geom_col].iloc[0]
         keep_rows = [0]
         i = 0
 
-        for index, row in temp_df.iterrows():
-            pt = row[traj.get_geom_column_name()]
+        for pt in traj.df[geom_col]:
             if traj.is_latlon:
                 dist = measure_distance_geodesic(pt, prev_pt)
             else:
@@ -159,8 +158,7 @@ class MaxDistanceGeneralizer(TrajectoryGeneralizer):
         keep_rows = []
         i = 0
 
-        for index, row in traj.df.iterrows():
-            current_pt = row[traj.get_geom_column_name()]
+        for current_pt in traj.df[traj.get_geom_column_name()]:
             if prev_pt is None:
                 prev_pt = current_pt
                 keep_rows.append(i)
@@ -207,8 +205,7 @@ class DouglasPeuckerGeneralizer(TrajectoryGeneralizer):
             traj.to_linestring().simplify(tolerance, preserve_topology=False).coords
         )
 
-        for index, row in traj.df.iterrows():
-            current_pt = row[traj.get_geom_column_name()]
+        for current_pt in traj.df[traj.get_geom_column_name()]:
             if current_pt.coords[0] in simplified:
                 keep_rows.append(i)
             i += 1
@@ -45,7 +45,7 @@ class _TrajectoryPlotter:
                 temp.add_speed(overwrite=True)
 
         line_gdf = temp._to_line_df()
-        line_gdf = line_gdf.drop([temp.get_geom_column_name(), "prev_pt"], axis=1)
+        line_gdf = line_gdf.drop([temp.get_geom_column_name()], axis=1)
         line_gdf = line_gdf.rename(columns={"line": "geometry"})
         line_gdf = line_gdf.set_geometry("geometry")
         if traj.crs:
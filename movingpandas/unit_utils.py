@@ -2,6 +2,9 @@ import warnings
 
 from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 
 UNITS = namedtuple(
@@ -205,6 +208,18 @@ def to_unixtime(t):
     return (t - datetime(1970, 1, 1, 0, 0, 0)).total_seconds()
 
 
+def to_unixtimes(ts):
+    """
+    Return float array of total seconds since Unix time for an array of
+    timestamps. Values are identical to calling to_unixtime on each timestamp.
+    """
+    us = (np.asarray(ts, dtype="datetime64[us]") - np.datetime64(0, "us")).astype(
+        np.int64
+    )
+    seconds, microseconds = np.divmod(us, 1_000_000)
+    return seconds + microseconds / 1_000_000
+
+
 def get_conversion(units, crs_units):
     """
     Looks up unit conversions in the unit dictionaries
@@ -213,7 +228,26 @@ def get_conversion(units, crs_units):
     If time2 specified, lookup time2 conversion
     Unit conversions default to 1 if not specified
     """
+    try:
+        conversion, unknown_crs_units = _lookup_conversion(units, crs_units)
+    except TypeError:  # unhashable units cannot be cached
+        conversion, unknown_crs_units = _lookup_conversion.__wrapped__(units, crs_units)
+    if unknown_crs_units:
+        warnings.warn(
+            "No valid CRS distance units. Computations will "
+            "assume CRS distance units are meters",
+            category=MissingCRSWarning,
+        )
+    return conversion
+
+
+@lru_cache(maxsize=64)
+def _lookup_conversion(units, crs_units):
+    """
+    Returns the unit conversions and whether the CRS distance units are unknown
+    """
     d_conv, t_conv, t2_conv, crs_conv = 1, 1, 1, 1
+    unknown_crs_units = False
 
     if isinstance(units, tuple):
         units = UNITS(*units)
@@ -236,11 +270,7 @@ def get_conversion(units, crs_units):
                 ][0]
             except (IndexError, AttributeError):
                 crs_conv = 1
-                warnings.warn(
-                    "No valid CRS distance units. Computations will "
-                    "assume CRS distance units are meters",
-                    category=MissingCRSWarning,
-                )
+                unknown_crs_units = True
             finally:
                 if units.time is not None:
                     try:
@@ -261,7 +291,7 @@ def get_conversion(units, crs_units):
                                 ][0]
                             except IndexError:
                                 raise ValueError("Invalid second time units!")
-    return UNITS(d_conv, t_conv, t2_conv, crs_conv)
+    return UNITS(d_conv, t_conv, t2_conv, crs_conv), unknown_crs_units
 
 
 class MissingCRSWarning(UserWarning, ValueError):